@@ -1,24 +1,130 @@
 import streamlit as st
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-from docx import Document
-from docx.shared import Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from lxml import etree
+import lxml.html
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import atexit
+import queue
+import threading
 import time
 import re
 import io
+from urllib.parse import urlsplit, urlunsplit
+
+# selenium, httpx and docx are imported where they are used, keeping app startup
+# light; Python caches the modules so only the first call pays for the import
 
 st.set_page_config(page_title="Web Content Scraper", page_icon="🌐", layout="wide")
 
+# Chrome drivers kept warm between scrapes, and how often each is reused
+POOL_SIZE = 2
+MAX_DRIVER_USES = 50
+
+# Seconds before driver.get() gives up and stops loading the page
+PAGE_LOAD_TIMEOUT = 15
+
+# Heavy resources that never affect the extracted text
+BLOCKED_URL_PATTERNS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.ico",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    "*.mp4",
+    "*.webm",
+    "*.mp3",
+]
+
+# Repeat scrapes of a URL within this window reuse the fetched and parsed page
+CACHE_TTL = 600
+CACHE_MAX_ENTRIES = 64
+
+# Plain HTTP fast path; pages with less extracted text than this need a browser
+FETCH_TIMEOUT = 10
+MIN_STATIC_TEXT_LENGTH = 500
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    " (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Half-way, bottom, then back to top, letting each scroll paint before the next
+SCROLL_SCRIPT = """
+const done = arguments[arguments.length - 1];
+const frame = () => new Promise((resolve) => requestAnimationFrame(resolve));
+const pause = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+async function scrollAndPaint(y) {
+    window.scrollTo(0, y);
+    await frame();
+}
+(async () => {
+    await scrollAndPaint(document.body.scrollHeight / 2);
+    await pause(500);
+    await scrollAndPaint(document.body.scrollHeight);
+    await pause(500);
+    await scrollAndPaint(0);
+    done();
+})();
+"""
+
+# Number of fetched subresources; stops changing once the network goes idle.
+# Chrome stops recording after 250 entries by default, which would look idle
+# on heavy pages, so the buffer is enlarged before counting starts
+RESOURCE_COUNT_SCRIPT = "return performance.getEntriesByType('resource').length"
+RESOURCE_BUFFER_SCRIPT = "performance.setResourceTimingBufferSize(10000)"
+
+# Main content container selectors, compiled once per process
+_RE_CONTENT_ID = re.compile(r"content|main", re.I)
+_RE_CONTENT_CLASS = re.compile(r"content|main|wrapper", re.I)
+
+# Empty client-side app mount point, i.e. a page rendered entirely by JS
+_RE_SPA_SHELL = re.compile(
+    r"<div[^>]*\sid=[\"']?(?:root|app|__next|__nuxt)(?=[\"'\s>])[^>]*>\s*</div>",
+    re.I,
+)
+
+# Charset declared in the markup, e.g. <meta charset="windows-1252">
+_RE_META_CHARSET = re.compile(rb"<meta[^>]+charset", re.I)
+
+# clean_text runs once per candidate block, so its tables are built up front.
+# Besides control characters this strips everything XML 1.0 rejects, which
+# python-docx would otherwise refuse when writing the .docx
+_RE_CONTROL_CHARS = re.compile(
+    r"[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f-\x9f\ud800-\udfff\ufffe\uffff]"
+)
+_RE_WHITESPACE = re.compile(r"\s+")
+_TEXT_TRANSLATION = str.maketrans({"\xa0": " ", "\u200b": "", "\ufeff": ""})
+
+# Tags whose subtrees never contribute text, and the blocks we collect
+_SKIP_TAGS = frozenset(["script", "style", "noscript", "iframe", "svg", "path"])
+_HEADING_TAGS = frozenset(["h1", "h2", "h3", "h4", "h5", "h6"])
+_CONTAINER_TAGS = frozenset(["a", "span", "div"])
+_BLOCK_TAGS = _HEADING_TAGS | _CONTAINER_TAGS | {"p", "li", "td", "blockquote"}
+
+# XPath expressions are compiled once and evaluated inside libxml2
+_NOT_SKIPPED = (
+    "not(ancestor-or-self::script or ancestor-or-self::style"
+    " or ancestor-or-self::noscript or ancestor-or-self::iframe"
+    " or ancestor-or-self::svg or ancestor-or-self::path)"
+)
+_TEXT_XPATH = etree.XPath(f"descendant::text()[{_NOT_SKIPPED}]", smart_strings=False)
+_MAIN_XPATH = etree.XPath(f"//main[{_NOT_SKIPPED}]")
+_ARTICLE_XPATH = etree.XPath(f"//article[{_NOT_SKIPPED}]")
+_SELECTOR_CANDIDATES_XPATH = etree.XPath(f"//*[@id or @class][{_NOT_SKIPPED}]")
+
 
 def setup_driver():
     """Alternative setup - Cloud compatible"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+
     chrome_options = Options()
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--no-sandbox")
@@ -29,8 +135,24 @@ def setup_driver():
         "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     )
     chrome_options.add_argument("--window-size=1920,1080")
+    # Nothing a text scraper needs; each one trims startup or background work
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-logging")
+    chrome_options.add_argument("--log-level=3")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--disable-translate")
+    chrome_options.add_argument("--mute-audio")
+    chrome_options.add_argument(
+        "--disable-features=Translate,BackForwardCache,AcceptCHFrame"
+    )
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option("useAutomationExtension", False)
+    chrome_options.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2}
+    )
+    # Return from get() on DOMContentLoaded; readiness is polled afterwards
+    chrome_options.page_load_strategy = "eager"
 
     # Add these lines for cloud deployment
     chrome_options.binary_location = "/usr/bin/chromium"
@@ -49,25 +171,145 @@ def setup_driver():
             service = Service(ChromeDriverManager().install())
             driver = webdriver.Chrome(service=service, options=chrome_options)
 
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    # Text-only scraping: never download images, fonts or media
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
     driver.execute_script(
         "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
     )
     return driver
 
 
+class DriverPool:
+    """Warm Chrome drivers shared across requests, recycled after max_uses"""
+
+    def __init__(self, size=POOL_SIZE, max_uses=MAX_DRIVER_USES):
+        self.max_uses = max_uses
+        self._idle = queue.Queue()
+        self._uses = {}
+        # Bounds the number of drivers alive at once across Streamlit sessions
+        self._slots = threading.BoundedSemaphore(size)
+
+    def acquire(self):
+        """Check out an idle driver, starting a new one if none is warm"""
+        self._slots.acquire()
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            # Chrome may have died while idle, e.g. killed under memory pressure
+            if self._is_alive(driver):
+                return driver
+            self._retire(driver)
+
+        try:
+            driver = setup_driver()
+        except Exception:
+            self._slots.release()
+            raise
+        self._uses[driver] = 0
+        return driver
+
+    def release(self, driver):
+        """Return a driver to the pool, or quit it once worn out or broken"""
+        try:
+            self._uses[driver] += 1
+            if self._uses[driver] >= self.max_uses:
+                self._retire(driver)
+                return
+
+            try:
+                driver.delete_all_cookies()
+                driver.get("about:blank")
+            except Exception:
+                self._retire(driver)
+                return
+
+            self._idle.put(driver)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """Quit every idle driver"""
+        while True:
+            try:
+                self._retire(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _retire(self, driver):
+        self._uses.pop(driver, None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+@st.cache_resource
+def get_driver_pool():
+    """Process-wide driver pool that survives Streamlit reruns"""
+    pool = DriverPool()
+    atexit.register(pool.close)
+    return pool
+
+
+def wait_until(driver, timeout, script):
+    """Poll a JS condition, carrying on with the current page if it times out"""
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException
+
+    try:
+        WebDriverWait(driver, timeout).until(lambda d: d.execute_script(script))
+    except TimeoutException:
+        pass
+
+
+def wait_for_network_idle(driver, interval=0.3, timeout=5):
+    """Wait until no new resource requests appear between two polls"""
+    deadline = time.monotonic() + timeout
+    driver.execute_script(RESOURCE_BUFFER_SCRIPT)
+    count = driver.execute_script(RESOURCE_COUNT_SCRIPT)
+    while time.monotonic() < deadline:
+        time.sleep(interval)
+        latest = driver.execute_script(RESOURCE_COUNT_SCRIPT)
+        if latest == count:
+            return
+        count = latest
+
+
 def fetch_with_selenium(url, progress_callback=None):
-    """EXACT SAME LOGIC AS YOUR WORKING SCRIPT"""
+    """Render a page in a pooled Chrome driver and return its HTML and title"""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
+
+    pool = get_driver_pool()
     driver = None
     try:
         if progress_callback:
             progress_callback("🌐 Starting Chrome browser...", 10)
 
-        driver = setup_driver()
+        driver = pool.acquire()
 
         if progress_callback:
             progress_callback(f"📡 Loading: {url}", 30)
 
-        driver.get(url)
+        try:
+            driver.get(url)
+        except TimeoutException:
+            # Keep whatever has rendered; one slow asset shouldn't sink the page
+            driver.execute_cdp_cmd("Page.stopLoading", {})
 
         if progress_callback:
             progress_callback(f"⏳ Waiting for page to load...", 50)
@@ -76,19 +318,16 @@ def fetch_with_selenium(url, progress_callback=None):
             EC.presence_of_element_located((By.TAG_NAME, "body"))
         )
 
-        # Additional wait for dynamic content
-        time.sleep(5)
+        # Wait for dynamic content instead of sleeping a fixed amount
+        wait_until(driver, 8, "return document.readyState === 'complete'")
+        wait_for_network_idle(driver)
 
         if progress_callback:
             progress_callback("📜 Scrolling page...", 70)
 
-        # Scroll to load lazy-loaded content
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-        time.sleep(2)
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
-        driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(1)
+        # Scroll to load lazy-loaded content, all in one browser round-trip
+        driver.execute_async_script(SCROLL_SCRIPT)
+        wait_for_network_idle(driver)
 
         html_content = driver.page_source
         page_title = driver.title
@@ -102,88 +341,225 @@ def fetch_with_selenium(url, progress_callback=None):
         raise Exception(f"Error fetching content: {str(e)}")
     finally:
         if driver:
-            driver.quit()
+            pool.release(driver)
+
+
+def fetch_fast(url):
+    """Fetch a server-rendered page over plain HTTP, or None if it needs a browser"""
+    import httpx
+
+    try:
+        with httpx.Client(
+            http2=True,
+            follow_redirects=True,
+            timeout=FETCH_TIMEOUT,
+            headers={"User-Agent": USER_AGENT},
+        ) as client:
+            response = client.get(url)
+        response.raise_for_status()
+    except httpx.HTTPError:
+        return None
+
+    if "html" not in response.headers.get("content-type", ""):
+        return None
+
+    if _RE_SPA_SHELL.search(response.text):
+        return None
+
+    # Without a charset in the Content-Type, httpx assumes UTF-8; hand lxml the
+    # raw bytes instead when the page declares its own <meta charset>
+    if response.charset_encoding or not _RE_META_CHARSET.search(response.content):
+        html_content = response.text
+    else:
+        html_content = response.content
+
+    try:
+        content_structure = cached_extract_content(html_content)
+    except (etree.ParserError, ValueError):
+        return None
+
+    if sum(len(item["text"]) for item in content_structure) < MIN_STATIC_TEXT_LENGTH:
+        return None
+
+    page_title = next(
+        (item["text"] for item in content_structure if item["type"] == "title"), ""
+    )
+    return html_content, page_title
+
+
+def fetch_page(url, progress_callback=None):
+    """Fetch a page over plain HTTP, falling back to Chrome for JS-rendered pages"""
+    if progress_callback:
+        progress_callback("⚡ Trying a direct fetch...", 5)
+
+    result = fetch_fast(url)
+    if result:
+        if progress_callback:
+            progress_callback("✓ Content fetched!", 90)
+        return result
+
+    return fetch_with_selenium(url, progress_callback)
+
+
+def normalize_url(url):
+    """Cache key for a URL: trimmed, with scheme and host lowercased"""
+    parts = urlsplit(url.strip())
+    return urlunsplit(
+        parts._replace(scheme=parts.scheme.lower(), netloc=parts.netloc.lower())
+    )
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after ttl seconds"""
+
+    def __init__(self, ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+@st.cache_resource
+def get_fetch_cache():
+    """Process-wide page cache that survives Streamlit reruns"""
+    return TTLCache()
+
+
+def cached_fetch(url, progress_callback=None):
+    """fetch_page, reusing recent results; progress is only reported on a miss"""
+    # Not st.cache_data: it would record the progress updates and fail to
+    # replay them onto this run's progress widgets on a cache hit
+    cache = get_fetch_cache()
+    result = cache.get(url)
+    if result is None:
+        result = fetch_page(url, progress_callback)
+        cache.put(url, result)
+    return result
 
 
 def clean_text(text):
     """Clean and normalize text"""
     if not text:
         return ""
-    text = re.sub(r"[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f-\x9f]", "", text)
-    text = re.sub(r"\s+", " ", text)
-    text = text.replace("\xa0", " ").replace("\u200b", "").replace("\ufeff", "")
-    return text.strip()
+    text = _RE_CONTROL_CHARS.sub("", text.translate(_TEXT_TRANSLATION))
+    return _RE_WHITESPACE.sub(" ", text).strip()
+
+
+def find_main_content(tree):
+    """Locate the element most likely to hold the page's main content"""
+    for xpath in (_MAIN_XPATH, _ARTICLE_XPATH):
+        found = xpath(tree)
+        if found:
+            return found[0]
+
+    # One scan serves both selectors; an id match still outranks a class match
+    class_match = None
+    for element in _SELECTOR_CANDIDATES_XPATH(tree):
+        if _RE_CONTENT_ID.search(element.get("id", "")):
+            return element
+        if class_match is None and _RE_CONTENT_CLASS.search(element.get("class", "")):
+            class_match = element
+
+    if class_match is not None:
+        return class_match
+
+    # Redirect stubs and interstitials can have no <body> at all
+    return tree.body if tree.body is not None else tree
 
 
 def extract_content(html_content):
     """Extract structured content from HTML"""
-    soup = BeautifulSoup(html_content, "html.parser")
-
-    for tag in soup(["script", "style", "noscript", "iframe", "svg", "path"]):
-        tag.decompose()
+    tree = lxml.html.document_fromstring(html_content)
 
     content_structure = []
-    processed_texts = set()
+    # Fingerprints of accepted texts bucketed by length; only equal-length
+    # texts can be duplicates, so each lookup checks a single small bucket
+    seen_by_length = defaultdict(set)
 
-    title = soup.find("title")
-    if title:
-        title_text = clean_text(title.get_text())
+    title = tree.find(".//title")
+    if title is not None:
+        title_text = clean_text(title.text_content())
         if title_text and len(title_text) > 3:
             content_structure.append({"type": "title", "text": title_text})
-            processed_texts.add(title_text)
+            seen_by_length[len(title_text)].add(hash(title_text))
 
-    meta_desc = soup.find("meta", attrs={"name": "description"})
-    if meta_desc and meta_desc.get("content"):
+    meta_desc = tree.find(".//meta[@name='description']")
+    if meta_desc is not None and meta_desc.get("content"):
         desc_text = clean_text(meta_desc.get("content"))
         if desc_text and len(desc_text) > 10:
             content_structure.append({"type": "paragraph", "text": desc_text})
-            processed_texts.add(desc_text)
-
-    main_content = (
-        soup.find("main")
-        or soup.find("article")
-        or soup.find(id=re.compile(r"content|main", re.I))
-        or soup.find(class_=re.compile(r"content|main|wrapper", re.I))
-        or soup.find("body")
-    )
+            seen_by_length[len(desc_text)].add(hash(desc_text))
+
+    main_content = find_main_content(tree)
+
+    # Single pass: unwanted subtrees are skipped in-line instead of removed first
+    walker = etree.iterwalk(main_content, events=("start",))
+    for _, element in walker:
+        if element.tag in _SKIP_TAGS:
+            walker.skip_subtree()
+            continue
+
+        if element is main_content or element.tag not in _BLOCK_TAGS:
+            continue
 
-    for element in main_content.find_all(
-        [
-            "h1",
-            "h2",
-            "h3",
-            "h4",
-            "h5",
-            "h6",
-            "p",
-            "li",
-            "td",
-            "blockquote",
-            "div",
-            "span",
-            "a",
-        ]
-    ):
-        text = clean_text(element.get_text(strip=True))
-
-        if not text or len(text) < 10 or text in processed_texts:
+        # Leaf blocks (most <p>/<li>) hold all their text directly
+        if len(element) == 0:
+            raw = element.text or ""
+        else:
+            raw = " ".join(_TEXT_XPATH(element))
+        text = clean_text(raw)
+
+        if not text or len(text) < 10:
             continue
 
-        if len(text) < 20 and element.name in ["a", "span", "div"]:
+        if len(text) < 20 and element.tag in _CONTAINER_TAGS:
             continue
 
-        processed_texts.add(text)
+        bucket = seen_by_length[len(text)]
+        text_hash = hash(text)
+        if text_hash in bucket:
+            continue
+        bucket.add(text_hash)
 
-        if element.name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-            content_structure.append({"type": element.name, "text": text})
+        if element.tag in _HEADING_TAGS:
+            content_structure.append({"type": element.tag, "text": text})
         elif len(text) > 30:
             content_structure.append({"type": "paragraph", "text": text})
 
     return content_structure
 
 
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def cached_extract_content(html_content):
+    """extract_content, reused for identical HTML"""
+    return extract_content(html_content)
+
+
 def create_word_document(content_structure):
     """Create a formatted Word document"""
+    from docx import Document
+    from docx.shared import Inches
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+
     doc = Document()
     sections = doc.sections
     for section in sections:
@@ -192,26 +568,34 @@ def create_word_document(content_structure):
         section.left_margin = Inches(1)
         section.right_margin = Inches(1)
 
+    # The paragraph.style setter rescans every style in the document on each
+    # call, so resolve the style ids once and write them straight to the XML
+    style_ids = {
+        name: doc.styles[name].style_id
+        for name in ["Title", "Heading 1", "Heading 2", "Heading 3", "Heading 4"]
+    }
+
+    def add_styled(text, style_id):
+        paragraph = doc.add_paragraph(text)
+        # Private oxml element; verified against the pinned python-docx==1.1.0
+        paragraph._p.style = style_id
+        return paragraph
+
+    def add_title(text):
+        heading = add_styled(text, style_ids["Title"])
+        heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        doc.add_paragraph()
+
+    handlers = {"title": add_title, "paragraph": doc.add_paragraph}
+    for level in range(1, 5):
+        handlers[f"h{level}"] = partial(
+            add_styled, style_id=style_ids[f"Heading {level}"]
+        )
+
     for item in content_structure:
-        try:
-            text = item["text"]
-
-            if item["type"] == "title":
-                heading = doc.add_heading(text, level=0)
-                heading.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                doc.add_paragraph()
-            elif item["type"] == "h1":
-                doc.add_heading(text, level=1)
-            elif item["type"] == "h2":
-                doc.add_heading(text, level=2)
-            elif item["type"] == "h3":
-                doc.add_heading(text, level=3)
-            elif item["type"] == "h4":
-                doc.add_heading(text, level=4)
-            elif item["type"] == "paragraph":
-                doc.add_paragraph(text)
-        except:
-            continue
+        handler = handlers.get(item["type"])
+        if handler:
+            handler(item["text"])
 
     doc_io = io.BytesIO()
     doc.save(doc_io)
@@ -219,28 +603,29 @@ def create_word_document(content_structure):
     return doc_io
 
 
-def create_text_file(content_structure):
-    """Create a plain text file"""
-    text_content = []
-
+def _iter_text_lines(content_structure):
+    """Yield the plain text file line by line"""
     for item in content_structure:
         text = item["text"]
 
         if item["type"] == "title":
-            text_content.append("=" * 80)
-            text_content.append(text.upper())
-            text_content.append("=" * 80)
-            text_content.append("")
+            yield "=" * 80
+            yield text.upper()
+            yield "=" * 80
+            yield ""
         elif item["type"] in ["h1", "h2", "h3", "h4"]:
             level = int(item["type"][1])
-            text_content.append("")
-            text_content.append("#" * level + " " + text)
-            text_content.append("")
+            yield ""
+            yield "#" * level + " " + text
+            yield ""
         elif item["type"] == "paragraph":
-            text_content.append(text)
-            text_content.append("")
+            yield text
+            yield ""
 
-    return "\n".join(text_content)
+
+def create_text_file(content_structure):
+    """Create a plain text file"""
+    return "\n".join(_iter_text_lines(content_structure))
 
 
 # ==================== STREAMLIT UI ====================
@@ -279,10 +664,10 @@ if scrape_button:
 
         try:
             # Fetch content
-            html_content, page_title = fetch_with_selenium(url, update_progress)
+            html_content, page_title = cached_fetch(normalize_url(url), update_progress)
 
             update_progress("Extracting content...", 95)
-            content_structure = extract_content(html_content)
+            content_structure = cached_extract_content(html_content)
 
             update_progress("Complete!", 100)
             time.sleep(0.5)
@@ -316,10 +701,18 @@ if scrape_button:
                 # Download section
                 st.subheader("💾 Download Files")
 
+                # Both builds are independent; the .docx one is the slower
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    doc_future = executor.submit(
+                        create_word_document, content_structure
+                    )
+                    text_future = executor.submit(create_text_file, content_structure)
+                    doc_io = doc_future.result()
+                    text_content = text_future.result()
+
                 col1, col2 = st.columns(2)
 
                 with col1:
-                    doc_io = create_word_document(content_structure)
                     st.download_button(
                         label="📄 Download Word Document (.docx)",
                         data=doc_io,
@@ -329,7 +722,6 @@ if scrape_button:
                     )
 
                 with col2:
-                    text_content = create_text_file(content_structure)
                     st.download_button(
                         label="📝 Download Text File (.txt)",
                         data=text_content,